@@ -1,35 +1,90 @@
+import queue
+import threading
+import time
+
+# Commands accepted by the worker thread
+_CMD_TOGGLE = 'toggle'
+_CMD_PLAY = 'play'
+_CMD_STOP = 'stop'
+_CMD_SHUTDOWN = 'shutdown'
+
+# Minimum seconds between repeated health-check failure warnings
+_MONITOR_WARNING_INTERVAL = 60.0
+
+
 class AudioManager:
-    """Manages ATC audio stream playback using a single, persistent VLC instance."""
-    def __init__(self, stream_url: str = None):
+    """
+    Manages ATC audio stream playback using a single, persistent VLC instance.
+
+    All VLC calls happen on a dedicated worker thread fed by a command queue, so a
+    stalled stream can never block the render loop. The worker also watches the
+    player state, reconnects with exponential backoff when the stream drops or
+    stalls, and records simple health metrics (see `health()`).
+
+    `stream_url` may be any MRL VLC understands, including a local file path, which
+    makes it easy to exercise the manager without a live feed. `vlc_module` can be
+    used to inject a stand-in for the `vlc` module.
+    """
+    # Seconds after play() during which a 'Stopped' state is not treated as a drop
+    START_GRACE = 2.0
+
+    def __init__(self, stream_url: str = None, auto_start: bool = False,
+                 reconnect_min_delay: float = 2.0, reconnect_max_delay: float = 60.0,
+                 stall_timeout: float = 20.0, poll_interval: float = 1.0, vlc_module=None):
         self.stream_url = stream_url
+        self.auto_start = auto_start
+        self.reconnect_min_delay = reconnect_min_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.stall_timeout = stall_timeout
+        self.poll_interval = poll_interval
         self.player = None
         self.instance = None
         self.initialised = False
 
+        self._vlc = vlc_module
+        self._commands = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        # State shared with the render thread and VLC callbacks (guarded by _lock)
+        self._wanted = False
+        self._playing = False
+        self._buffering = False
+        self._dropped = False
+        self._buffering_events = 0
+        self._stream_errors = 0
+        self._reconnects = 0
+        self._bitrate_kbps = 0.0
+        self._started_at = None
+
+        # Worker-only state
+        self._play_started = 0.0
+        self._stall_since = None
+        self._retry_delay = reconnect_min_delay
+        self._next_retry = None
+        self._monitor_failures = 0
+        self._last_monitor_warning = None
+
     def initialise(self) -> bool:
         """
-        Initialises the VLC instance and loads the stream.
+        Initialises the VLC instance and starts the audio worker thread.
         The 'vlc' module is imported here to make it an optional dependency.
         """
         if self.initialised:
             return False  # Already initialised, no need to reinitialise
-    
+
         if not self.stream_url:
             return False  # Can't initialise without a stream URL
 
         try:
-            import vlc
+            if self._vlc is None:
+                import vlc
+                self._vlc = vlc
 
-            self.instance = vlc.Instance()
+            self.instance = self._vlc.Instance()
             self.player = self.instance.media_player_new()
-            media = self.instance.media_new(self.stream_url)
-            media.add_option(':network-caching=10000')
-            media.add_option(':clock-jitter=0')
-            media.add_option(':clock-synchro=0')
-            self.player.set_media(media)
-            self.initialised = True
-            print("✅ Audio manager initialised successfully")
-            return True
+            self._attach_events()
+            self._load_media()
         except ModuleNotFoundError:
             print("❌ Error: 'python-vlc' not found. Please install it to use the audio feature.")
             return False
@@ -39,33 +94,251 @@ class AudioManager:
             self.instance = None
             return False
 
+        self.initialised = True
+        self._thread = threading.Thread(target=self._run, name='audio-worker', daemon=True)
+        self._thread.start()
+        print("✅ Audio manager initialised successfully")
+
+        if self.auto_start:
+            self._commands.put(_CMD_PLAY)
+        return True
+
     def toggle(self):
-        """Toggles the audio stream on or off."""
-        if not self.player:
-            return
+        """Queues a request to toggle the audio stream on or off."""
+        if self.initialised:
+            self._commands.put(_CMD_TOGGLE)
 
-        if self.player.is_playing():
-            self.player.stop()
-            print("✅ Audio stream stopped")
-        else:
-            self.player.play()
-            print("✅ Audio stream started")
+    def play(self):
+        """Queues a request to start the audio stream."""
+        if self.initialised:
+            self._commands.put(_CMD_PLAY)
+
+    def stop(self):
+        """Queues a request to stop the audio stream."""
+        if self.initialised:
+            self._commands.put(_CMD_STOP)
 
     def is_playing(self) -> bool:
-        """Returns True if the audio stream is currently playing."""
-        if not self.player:
-            return False
-        return self.player.is_playing()
+        """Returns True if the audio stream is currently playing (last state seen by the worker)."""
+        with self._lock:
+            return self._playing
+
+    def health(self) -> dict:
+        """Returns a snapshot of the stream health metrics."""
+        with self._lock:
+            uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+            return {
+                'wanted': self._wanted,
+                'playing': self._playing,
+                'uptime': uptime,
+                'bitrate_kbps': self._bitrate_kbps,
+                'buffering_events': self._buffering_events,
+                'stream_errors': self._stream_errors,
+                'reconnects': self._reconnects,
+            }
 
-    def shutdown(self):
+    def shutdown(self, timeout: float = 2.0):
         """Stops playback and releases VLC resources cleanly."""
+        if self._thread:
+            self._commands.put(_CMD_SHUTDOWN)
+            self._thread.join(timeout)
+            self._thread = None
+
+        if self.initialised:
+            h = self.health()
+            print(f"✅ Audio shut down cleanly ({h['reconnects']} reconnects, "
+                  f"{h['buffering_events']} buffering events, {h['stream_errors']} stream errors)")
+        self.initialised = False
+
+    # --- VLC event callbacks (run on libvlc's own thread; must not call back into VLC) ---
+
+    def _attach_events(self):
+        """Subscribes to the player events used for health metrics."""
+        EventType = self._vlc.EventType
+        events = self.player.event_manager()
+        events.event_attach(EventType.MediaPlayerBuffering, self._on_buffering)
+        events.event_attach(EventType.MediaPlayerPlaying, self._on_playing)
+        events.event_attach(EventType.MediaPlayerEncounteredError, self._on_dropped)
+        events.event_attach(EventType.MediaPlayerEndReached, self._on_dropped)
+
+    def _on_buffering(self, event):
+        # VLC sends a stream of these with the fill level; count each episode once
+        cache = getattr(getattr(event, 'u', None), 'new_cache', 0)
+        with self._lock:
+            if cache >= 100:
+                self._buffering = False
+            elif not self._buffering:
+                self._buffering = True
+                self._buffering_events += 1
+
+    def _on_playing(self, event):
+        with self._lock:
+            self._buffering = False
+
+    def _on_dropped(self, event):
+        with self._lock:
+            self._buffering = False
+            self._dropped = True
+            self._stream_errors += 1
+
+    # --- Worker thread -------------------------------------------------------
+
+    def _run(self):
+        """Worker loop: executes queued commands and monitors stream health."""
+        while True:
+            try:
+                cmd = self._commands.get(timeout=self.poll_interval)
+            except queue.Empty:
+                cmd = None
+
+            if cmd == _CMD_SHUTDOWN:
+                break
+
+            try:
+                if cmd == _CMD_TOGGLE:
+                    if self._wanted:
+                        self._stop()
+                    else:
+                        self._play()
+                elif cmd == _CMD_PLAY:
+                    self._play()
+                elif cmd == _CMD_STOP:
+                    self._stop()
+            except Exception as e:
+                print(f"⚠️ Warning: Audio command '{cmd}' failed: {e}")
+
+            # The watchdog must keep running, so failures are only rate-limited in the log
+            try:
+                self._monitor()
+                self._monitor_failures = 0
+            except Exception as e:
+                self._monitor_failures += 1
+                now = time.monotonic()
+                if self._last_monitor_warning is None or now - self._last_monitor_warning >= _MONITOR_WARNING_INTERVAL:
+                    self._last_monitor_warning = now
+                    print(f"⚠️ Warning: Audio health check failed ({self._monitor_failures} in a row): {e}")
+
+        self._release()
+
+    def _load_media(self):
+        """Creates a fresh media object for the stream and attaches it to the player."""
+        media = self.instance.media_new(self.stream_url)
+        media.add_option(':network-caching=10000')
+        media.add_option(':clock-jitter=0')
+        media.add_option(':clock-synchro=0')
+        self.player.set_media(media)
+
+    def _play(self):
+        with self._lock:
+            self._wanted = True
+            self._dropped = False
+        self._retry_delay = self.reconnect_min_delay
+        self._next_retry = None
+        self._stall_since = None
+        self._play_started = time.monotonic()
+        self.player.play()
+        print("✅ Audio stream started")
+
+    def _stop(self):
+        with self._lock:
+            self._wanted = False
+            self._playing = False
+            self._dropped = False
+            self._started_at = None
+            self._bitrate_kbps = 0.0
+        self._next_retry = None
+        self._stall_since = None
+        self.player.stop()
+        print("✅ Audio stream stopped")
+
+    def _monitor(self):
+        """Polls the player state, updates metrics and schedules reconnects."""
+        State = self._vlc.State
+        state = self.player.get_state()
+        now = time.monotonic()
+
+        playing = state == State.Playing
+        bitrate = self._update_bitrate() if playing else None
+        with self._lock:
+            wanted = self._wanted
+            dropped, self._dropped = self._dropped, False
+            self._playing = playing
+            if playing and self._started_at is None:
+                self._started_at = now
+            elif not playing and state != State.Buffering:
+                self._started_at = None
+                self._bitrate_kbps = 0.0
+
+        if not wanted:
+            self._next_retry = None
+            self._stall_since = None
+            return
+
+        # Decide whether the stream is healthy, still starting up, or needs a reconnect
+        problem = None
+        if dropped or state in (State.Ended, State.Error):
+            problem = 'lost'
+        elif state == State.Stopped:
+            if now - self._play_started > self.START_GRACE:
+                problem = 'lost'
+        elif state in (State.Opening, State.Buffering) or (playing and bitrate == 0):
+            if self._stall_since is None:
+                self._stall_since = now
+            elif now - self._stall_since > self.stall_timeout:
+                problem = 'stalled'
+        elif playing:
+            # Only back off again from the minimum once data is actually flowing
+            self._stall_since = None
+            self._next_retry = None
+            self._retry_delay = self.reconnect_min_delay
+
+        if problem is None:
+            return
+
+        if self._next_retry is None:
+            self._next_retry = now + self._retry_delay
+            print(f"⚠️ Warning: Audio stream {problem}, reconnecting in {self._retry_delay:.0f}s")
+        elif now >= self._next_retry:
+            self._reconnect(now)
+
+    def _reconnect(self, now: float):
+        """Reloads the stream and doubles the delay before the next attempt."""
+        self._retry_delay = min(self._retry_delay * 2, self.reconnect_max_delay)
+        self._next_retry = None
+        self._stall_since = None
+        self._play_started = now
+        with self._lock:
+            self._reconnects += 1
+            self._dropped = False
+        self.player.stop()
+        self._load_media()
+        self.player.play()
+
+    def _update_bitrate(self):
+        """Reads the input bitrate from VLC's media statistics; returns None if unavailable."""
+        try:
+            media = self.player.get_media()
+            if media is None:
+                return None
+            stats = self._vlc.MediaStats()
+            if not media.get_stats(stats):
+                return None
+        except Exception:
+            return None  # Older python-vlc bindings lack or break stats; treat as unknown
+        # libvlc reports bytes per microsecond; x8000 gives kbit/s
+        bitrate = stats.input_bitrate * 8000
+        with self._lock:
+            self._bitrate_kbps = bitrate
+        return bitrate
+
+    def _release(self):
         if self.player:
             self.player.stop()
         if self.instance:
             self.instance.release()
         self.player = None
         self.instance = None
-
-        if self.initialised:
-            print("✅ Audio shut down cleanly")
-
+        with self._lock:
+            self._wanted = False
+            self._playing = False
+            self._started_at = None
@@ -8,6 +8,7 @@ config_path = os.path.join(script_dir, "config.ini")
 config.read(config_path)
 
 # General Settings
+LOG_LEVEL = config.get('General', 'LOG_LEVEL', fallback='ERROR')
 FETCH_INTERVAL = config.getint('General', 'FETCH_INTERVAL', fallback=10)
 MIL_PREFIX_LIST = [prefix.strip() for prefix in config.get('General', 'MIL_PREFIX_LIST', fallback='7CF').split(',')]
 TAR1090_URL = config.get('General', 'TAR1090_URL', fallback='http://localhost/data/aircraft.json')
@@ -16,6 +17,8 @@ BLINK_MILITARY = config.getboolean('General', 'BLINK_MILITARY', fallback=True)
 # Audio Settings
 ATC_STREAM_URL = config.get('Audio', 'ATC_STREAM_URL', fallback='')
 ATC_AUTO_START = config.getboolean('Audio', 'AUTO_START', fallback=False)
+ATC_RECONNECT_MAX_DELAY = config.getint('Audio', 'RECONNECT_MAX_DELAY', fallback=60)
+ATC_STALL_TIMEOUT = config.getint('Audio', 'STALL_TIMEOUT', fallback=20)
 
 # Location Settings
 LAT = config.getfloat('Location', 'LAT', fallback=0.0)
@@ -29,6 +32,8 @@ RADAR_ROTATION = config.getint('Location', 'RADAR_ROTATION', fallback=0)
 SCREEN_WIDTH = config.getint('Display', 'SCREEN_WIDTH', fallback=960)
 SCREEN_HEIGHT = config.getint('Display', 'SCREEN_HEIGHT', fallback=640)
 FPS = config.getint('Display', 'FPS', fallback=6)
+IDLE_FPS = config.getint('Display', 'IDLE_FPS', fallback=2)
+SHOW_PERF = config.getboolean('Display', 'SHOW_PERF', fallback=False)
 MAX_TABLE_ROWS = config.getint('Display', 'MAX_TABLE_ROWS', fallback=10)
 FONT_PATH = config.get('Display', 'FONT_PATH', fallback='fonts/TerminusTTF-4.49.3.ttf')
 BACKGROUND_PATH = config.get('Display', 'BACKGROUND_PATH', fallback=None)
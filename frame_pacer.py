@@ -0,0 +1,105 @@
+import time
+
+EMERGENCY_SQUAWKS = ('7700', '7500', '7600')
+
+
+class FramePacer:
+    """
+    Picks the target frame rate for each frame based on what is on the scope.
+
+    Full rate is used while there is something worth animating smoothly (an
+    emergency squawk, or a short burst after a new contact appears). Otherwise the
+    rate is lowered when the sky is empty, when the data has not changed, or in
+    night mode, to keep fanless enclosures cool. Achieved FPS and CPU time per
+    frame are tracked as moving averages for reporting.
+
+    A contact only counts as new if it hasn't been seen for `forget_after` seconds,
+    so aircraft that briefly drop out of the feed don't keep re-triggering the boost.
+    All internal timing uses the monotonic clock so NTP corrections can't skew it.
+    """
+    def __init__(self, max_fps: int, idle_fps: int, stale_after: float = 10.0,
+                 boost_duration: float = 5.0, forget_after: float = 60.0, smoothing: float = 0.1):
+        self.max_fps = max(1, max_fps)
+        self.idle_fps = max(1, min(idle_fps, self.max_fps))
+        self.stale_after = stale_after
+        self.boost_duration = boost_duration
+        self.forget_after = forget_after
+        self.smoothing = smoothing
+        self.target_fps = self.max_fps
+        self.reason = 'startup'
+
+        self.last_seen = {}
+        self.boost_until = 0.0
+        self.data_signature = None
+        self.last_update = 0
+        self.last_change = time.monotonic()
+
+        self.achieved_fps = 0.0
+        self.cpu_ms = 0.0
+        self._last_wall = None
+        self._last_cpu = None
+
+    def update(self, aircraft_list, last_update: float, night: bool) -> int:
+        """Returns the target FPS for the next frame given the current contacts."""
+        now = time.monotonic()
+
+        for a in aircraft_list:
+            hex_code = getattr(a, 'hex', None)
+            if hex_code not in self.last_seen:
+                self.boost_until = now + self.boost_duration
+            self.last_seen[hex_code] = now
+        for hex_code in [h for h, seen in self.last_seen.items() if now - seen > self.forget_after]:
+            del self.last_seen[hex_code]
+
+        # Only re-check the data when the tracker delivers a new fetch
+        if last_update != self.last_update:
+            self.last_update = last_update
+            signature = tuple(sorted(
+                (getattr(a, 'hex', ''), a.lat, a.lon, getattr(a, 'altitude', 0), getattr(a, 'squawk', ''))
+                for a in aircraft_list
+            ))
+            if signature != self.data_signature:
+                self.data_signature = signature
+                self.last_change = now
+        data_stale = now - self.last_change > self.stale_after
+
+        if any(getattr(a, 'squawk', '') in EMERGENCY_SQUAWKS for a in aircraft_list):
+            fps, reason = self.max_fps, 'emergency'
+        elif now < self.boost_until:
+            fps, reason = self.max_fps, 'new contact'
+        elif not aircraft_list:
+            fps, reason = self.idle_fps, 'no contacts'
+        else:
+            fps, reasons = self.max_fps, []
+            if night:
+                fps, reasons = fps / 2, reasons + ['night']
+            if data_stale:
+                fps, reasons = fps / 2, reasons + ['data unchanged']
+            fps, reason = max(self.idle_fps, int(fps)), ', '.join(reasons) or 'active'
+
+        self.target_fps, self.reason = fps, reason
+        return fps
+
+    def frame_done(self):
+        """
+        Records wall and CPU time since the previous call; call once per frame from
+        the render thread. CPU time is per-thread so the audio decoder and the data
+        fetcher aren't counted as render cost.
+        """
+        wall, cpu = time.perf_counter(), time.thread_time()
+        if self._last_wall is not None:
+            dt_wall, dt_cpu = wall - self._last_wall, cpu - self._last_cpu
+            if dt_wall > 0:
+                a = self.smoothing
+                self.achieved_fps += a * (1.0 / dt_wall - self.achieved_fps)
+                self.cpu_ms += a * (dt_cpu * 1000 - self.cpu_ms)
+        self._last_wall, self._last_cpu = wall, cpu
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the pacing metrics."""
+        return {
+            'target_fps': self.target_fps,
+            'achieved_fps': round(self.achieved_fps, 1),
+            'cpu_ms_per_frame': round(self.cpu_ms, 2),
+            'reason': self.reason,
+        }
@@ -10,6 +10,7 @@ import config
 import utils
 from audio_manager import AudioManager
 from data_fetcher import AircraftTracker
+from frame_pacer import FramePacer
 from ui_components import RadarScope, DataTable
 
 # Map string from .ini to logging constants
@@ -77,6 +78,7 @@ def save_privacy_screenshot(surface, font, theme):
 
 def main():
     tracker = None
+    audio = None
     try:
         logging.info(f"System boot at {datetime.now()}. Log Level: {getattr(config, 'LOG_LEVEL', 'ERROR')}")
         pygame.display.init()
@@ -90,10 +92,14 @@ def main():
         radar_surface = pygame.Surface((config.SCREEN_WIDTH + 10, config.SCREEN_HEIGHT + 10))
         
         clock = pygame.time.Clock()
+        pacer = FramePacer(config.FPS, config.IDLE_FPS, stale_after=2 * config.FETCH_INTERVAL)
         background = utils.load_background(config.BACKGROUND_PATH) if config.BACKGROUND_PATH else None
         font_cache = {'header': utils.load_font(config.HEADER_FONT_SIZE)}
 
-        audio = AudioManager(config.ATC_STREAM_URL)
+        audio = AudioManager(config.ATC_STREAM_URL, auto_start=config.ATC_AUTO_START,
+                             reconnect_max_delay=config.ATC_RECONNECT_MAX_DELAY,
+                             stall_timeout=config.ATC_STALL_TIMEOUT)
+        audio.initialise()
         tracker = AircraftTracker()
         tracker.start()
 
@@ -104,6 +110,7 @@ def main():
         table = DataTable(radar_surface, 395, 85, 880, config.SCREEN_HEIGHT - 110)
 
         last_jitter_time = time.time()
+        last_pacing_log = time.time()
         off_x, off_y = 0, 0
 
         running = True
@@ -117,6 +124,13 @@ def main():
                 off_y = (off_y + 1) % 5
                 last_jitter_time = now
 
+            # Frame Pacing & Audio Health Report: Every minute
+            if now - last_pacing_log > 60:
+                logging.info(f"Frame pacing: {pacer.stats()}")
+                if audio.initialised:
+                    logging.info(f"Audio health: {audio.health()}")
+                last_pacing_log = now
+
             # Draw Background
             if background:
                 radar_surface.blit(background, (0, 0))
@@ -135,6 +149,13 @@ def main():
             radar.draw(current_aircraft, theme, tracker.last_update)
             table.draw(current_aircraft, tracker.status, tracker.last_update, theme)
 
+            # Optional Performance Overlay (bottom left)
+            if config.SHOW_PERF:
+                stats = pacer.stats()
+                perf_text = f"FPS {stats['achieved_fps']:.1f}/{stats['target_fps']} CPU {stats['cpu_ms_per_frame']:.1f}MS"
+                perf = radar.font.render(perf_text, True, theme['bright_green'])
+                radar_surface.blit(perf, (10, radar_surface.get_height() - perf.get_height() - 5))
+
             # Rotate & Blit to Screen
             rotated_final = pygame.transform.rotate(radar_surface, 90)
             physical_screen.blit(rotated_final, (-off_x, -off_y))
@@ -165,7 +186,9 @@ def main():
                     if fname:
                         logging.info(f"KEYBOARD CAPTURE: Saved {fname}")
 
-            clock.tick(config.FPS)
+            target_fps = pacer.update(current_aircraft, tracker.last_update, theme['brightness'] < 1.0)
+            clock.tick(target_fps)
+            pacer.frame_done()
 
     except Exception:
         logging.error("Fatal exception in main loop:")
@@ -174,6 +197,8 @@ def main():
     finally:
         if tracker:
             tracker.running = False
+        if audio:
+            audio.shutdown()
         pygame.quit()
         sys.exit()
 
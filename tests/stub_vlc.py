@@ -0,0 +1,104 @@
+"""A minimal stand-in for the `vlc` module, used to drive AudioManager in tests."""
+import enum
+import types
+
+
+class State(enum.Enum):
+    NothingSpecial = 0
+    Opening = 1
+    Buffering = 2
+    Playing = 3
+    Paused = 4
+    Stopped = 5
+    Ended = 6
+    Error = 7
+
+
+class EventType(enum.Enum):
+    MediaPlayerBuffering = 259
+    MediaPlayerPlaying = 260
+    MediaPlayerEndReached = 265
+    MediaPlayerEncounteredError = 266
+
+
+class MediaStats:
+    input_bitrate = 0.0
+
+
+class Media:
+    def __init__(self, mrl):
+        self.mrl = mrl
+        self.options = []
+
+    def add_option(self, option):
+        self.options.append(option)
+
+    def get_stats(self, stats):
+        stats.input_bitrate = self.player.input_bitrate
+        return True
+
+
+class EventManager:
+    def __init__(self):
+        self.callbacks = {}
+
+    def event_attach(self, event_type, callback):
+        self.callbacks.setdefault(event_type, []).append(callback)
+
+    def fire(self, event_type, new_cache=0):
+        event = types.SimpleNamespace(type=event_type, u=types.SimpleNamespace(new_cache=new_cache))
+        for callback in self.callbacks.get(event_type, []):
+            callback(event)
+
+
+class MediaPlayer:
+    def __init__(self):
+        self.state = State.NothingSpecial
+        # State the player moves to on play(); tests change this to simulate a bad stream
+        self.state_on_play = State.Playing
+        self.input_bitrate = 0.016  # 128 kbit/s
+        self.media = None
+        self.play_calls = []
+        self.events = EventManager()
+
+    def event_manager(self):
+        return self.events
+
+    def set_media(self, media):
+        media.player = self
+        self.media = media
+
+    def get_media(self):
+        return self.media
+
+    def play(self):
+        self.play_calls.append(self.media)
+        self.state = self.state_on_play
+
+    def stop(self):
+        self.state = State.Stopped
+
+    def get_state(self):
+        return self.state
+
+
+class Instance:
+    def __init__(self, *args):
+        self.released = False
+
+    def media_player_new(self):
+        self.player = MediaPlayer()
+        return self.player
+
+    def media_new(self, mrl):
+        return Media(mrl)
+
+    def release(self):
+        self.released = True
+
+
+def module(**overrides):
+    """Returns a namespace that looks like the `vlc` module."""
+    attrs = dict(Instance=Instance, State=State, EventType=EventType, MediaStats=MediaStats)
+    attrs.update(overrides)
+    return types.SimpleNamespace(**attrs)
@@ -0,0 +1,190 @@
+import time
+
+import pytest
+
+import stub_vlc
+from audio_manager import AudioManager
+
+State = stub_vlc.State
+EventType = stub_vlc.EventType
+
+
+def wait_until(predicate, timeout=2.0):
+    """Polls `predicate` until it is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def make_audio():
+    managers = []
+
+    def factory(vlc=None, **kwargs):
+        kwargs.setdefault('reconnect_min_delay', 0.2)
+        kwargs.setdefault('reconnect_max_delay', 1.0)
+        kwargs.setdefault('stall_timeout', 0.2)
+        kwargs.setdefault('poll_interval', 0.01)
+        audio = AudioManager('file:///tmp/atc.mp3', vlc_module=vlc or stub_vlc.module(), **kwargs)
+        audio.START_GRACE = 0.1
+        managers.append(audio)
+        return audio
+
+    yield factory
+    for audio in managers:
+        audio.shutdown()
+
+
+def test_initialise_requires_stream_url():
+    assert not AudioManager('', vlc_module=stub_vlc.module()).initialise()
+
+
+def test_auto_start_plays_on_initialise(make_audio):
+    audio = make_audio(auto_start=True)
+    assert audio.initialise()
+    assert wait_until(audio.is_playing)
+    health = audio.health()
+    assert health['wanted'] and health['bitrate_kbps'] == pytest.approx(128)
+
+
+def test_no_auto_start_stays_silent(make_audio):
+    audio = make_audio()
+    audio.initialise()
+    time.sleep(0.05)
+    assert not audio.is_playing()
+    assert audio.player.play_calls == []
+
+
+def test_toggle_starts_and_stops(make_audio):
+    audio = make_audio()
+    audio.initialise()
+    audio.toggle()
+    assert wait_until(audio.is_playing)
+    audio.toggle()
+    assert wait_until(lambda: not audio.is_playing())
+    assert audio.player.state == State.Stopped
+    assert not audio.health()['wanted']
+
+
+def test_drop_reconnects_after_backoff(make_audio):
+    audio = make_audio(auto_start=True)
+    audio.initialise()
+    assert wait_until(audio.is_playing)
+
+    dropped_at = time.monotonic()
+    audio.player.state = State.Ended
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+    assert time.monotonic() - dropped_at >= audio.reconnect_min_delay
+    assert len(audio.player.play_calls) == 2
+    assert wait_until(audio.is_playing)
+
+
+def test_backoff_doubles_while_stream_stays_down(make_audio):
+    audio = make_audio(auto_start=True)
+    audio.initialise()
+    assert wait_until(audio.is_playing)
+
+    audio.player.state_on_play = State.Error
+    audio.player.state = State.Error
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+    first = time.monotonic()
+    assert wait_until(lambda: audio.health()['reconnects'] == 2)
+    assert time.monotonic() - first >= 2 * audio.reconnect_min_delay
+
+
+def test_slow_start_is_not_reported_as_a_drop(make_audio, capsys):
+    audio = make_audio()
+    audio.initialise()
+    audio.player.state_on_play = State.Stopped
+    audio.play()
+    assert wait_until(lambda: audio.player.play_calls)
+    audio.player.state = State.Playing
+    assert wait_until(audio.is_playing)
+    assert 'reconnecting' not in capsys.readouterr().out
+
+    # A later drop must still wait for the backoff delay
+    dropped_at = time.monotonic()
+    audio.player.state = State.Ended
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+    assert time.monotonic() - dropped_at >= audio.reconnect_min_delay
+
+
+@pytest.mark.parametrize('stuck_state', [State.Opening, State.Buffering])
+def test_stall_triggers_reconnect(make_audio, stuck_state):
+    audio = make_audio()
+    audio.initialise()
+    audio.player.state_on_play = stuck_state
+    audio.play()
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+
+
+def test_playing_without_data_triggers_reconnect(make_audio):
+    audio = make_audio()
+    audio.initialise()
+    audio.player.input_bitrate = 0.0
+    audio.play()
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+
+
+def test_events_update_counters(make_audio):
+    audio = make_audio()
+    audio.initialise()
+    events = audio.player.events
+    for cache in (10, 50, 100):
+        events.fire(EventType.MediaPlayerBuffering, cache)
+    events.fire(EventType.MediaPlayerBuffering, 20)
+    events.fire(EventType.MediaPlayerPlaying)
+    events.fire(EventType.MediaPlayerEncounteredError)
+    health = audio.health()
+    assert health['buffering_events'] == 2
+    assert health['stream_errors'] == 1
+
+
+def test_repeated_health_check_failures_keep_watchdog_running(make_audio, capsys):
+    audio = make_audio(auto_start=True)
+    audio.initialise()
+    assert wait_until(audio.is_playing)
+
+    player = audio.player
+    real_get_state = player.get_state
+    failures = []
+
+    def flaky_get_state():
+        if len(failures) < 20:
+            failures.append(1)
+            raise RuntimeError('libvlc hiccup')
+        return real_get_state()
+
+    player.get_state = flaky_get_state
+    assert wait_until(lambda: len(failures) == 20)
+    assert capsys.readouterr().out.count('health check failed') == 1
+
+    player.state = State.Ended
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+
+
+def test_missing_bitrate_stats_do_not_stop_reconnects(make_audio):
+    class BrokenStats:
+        def __init__(self):
+            raise AttributeError('MediaStats')
+
+    audio = make_audio(vlc=stub_vlc.module(MediaStats=BrokenStats), auto_start=True)
+    audio.initialise()
+    assert wait_until(audio.is_playing)
+    time.sleep(audio.stall_timeout * 2)
+    assert audio.health()['reconnects'] == 0
+
+    audio.player.state = State.Ended
+    assert wait_until(lambda: audio.health()['reconnects'] == 1)
+
+
+def test_shutdown_releases_vlc(make_audio):
+    audio = make_audio(auto_start=True)
+    audio.initialise()
+    instance = audio.instance
+    audio.shutdown()
+    assert instance.released
+    assert not audio.is_playing()
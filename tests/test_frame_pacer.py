@@ -0,0 +1,131 @@
+import types
+
+import pytest
+
+import frame_pacer
+from frame_pacer import FramePacer
+
+
+class FakeClock:
+    """Replaces the monotonic clock used by FramePacer."""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(frame_pacer.time, 'monotonic', fake)
+    return fake
+
+
+def aircraft(hex_code, squawk='1000', lat=51.0):
+    return types.SimpleNamespace(hex=hex_code, squawk=squawk, lat=lat, lon=-114.0, altitude=5000)
+
+
+def make_pacer(**kwargs):
+    kwargs.setdefault('stale_after', 10)
+    kwargs.setdefault('boost_duration', 5)
+    kwargs.setdefault('forget_after', 60)
+    return FramePacer(16, 2, **kwargs)
+
+
+def settle(pacer, clock, contacts, night=False):
+    """Lets the new-contact boost expire while keeping the data fresh."""
+    pacer.update(contacts, 1, night)
+    clock.now += 6
+    return pacer.update(contacts, 2, night)
+
+
+def test_idle_when_no_contacts(clock):
+    pacer = make_pacer()
+    assert pacer.update([], 0, False) == 2
+    assert pacer.stats()['reason'] == 'no contacts'
+
+
+def test_full_rate_with_fresh_contacts(clock):
+    pacer = make_pacer()
+    assert settle(pacer, clock, [aircraft('a')]) == 16
+    assert pacer.reason == 'active'
+
+
+def test_new_contact_boost_expires(clock):
+    pacer = make_pacer()
+    assert pacer.update([aircraft('a')], 1, True) == 16
+    assert pacer.reason == 'new contact'
+    clock.now += 6
+    assert pacer.update([aircraft('a')], 1, True) == 8
+
+
+def test_returning_contact_does_not_boost(clock):
+    pacer = make_pacer()
+    settle(pacer, clock, [aircraft('a')], night=True)
+    pacer.update([], 3, True)
+    clock.now += 1
+    assert pacer.update([aircraft('a')], 4, True) == 8
+
+
+def test_contact_forgotten_after_timeout_boosts_again(clock):
+    pacer = make_pacer()
+    settle(pacer, clock, [aircraft('a')], night=True)
+    clock.now += 61
+    pacer.update([], 3, True)
+    assert pacer.update([aircraft('a')], 4, True) == 16
+
+
+def test_night_halves_rate(clock):
+    pacer = make_pacer()
+    assert settle(pacer, clock, [aircraft('a')], night=True) == 8
+    assert pacer.reason == 'night'
+
+
+def test_unchanged_data_halves_rate(clock):
+    pacer = make_pacer()
+    contacts = [aircraft('a')]
+    settle(pacer, clock, contacts)
+    clock.now += 11
+    assert pacer.update(contacts, 3, False) == 8
+    assert pacer.reason == 'data unchanged'
+
+    # Moving aircraft count as changed data
+    assert pacer.update([aircraft('a', lat=51.1)], 4, False) == 16
+
+
+def test_night_and_stale_never_go_below_idle(clock):
+    pacer = FramePacer(6, 2, stale_after=10, boost_duration=5)
+    settle(pacer, clock, [aircraft('a')], night=True)
+    clock.now += 11
+    assert pacer.update([aircraft('a')], 2, True) == 2
+    assert pacer.reason == 'night, data unchanged'
+
+
+@pytest.mark.parametrize('squawk', ['7700', '7500', '7600'])
+def test_emergency_overrides_night_and_stale(clock, squawk):
+    pacer = make_pacer()
+    settle(pacer, clock, [aircraft('a')], night=True)
+    clock.now += 11
+    assert pacer.update([aircraft('a', squawk=squawk)], 2, True) == 16
+    assert pacer.reason == 'emergency'
+
+
+def test_idle_fps_clamped_to_max():
+    pacer = FramePacer(4, 10)
+    assert pacer.idle_fps == 4
+    assert FramePacer(0, 0).idle_fps == 1
+
+
+def test_stats_track_frame_time(monkeypatch):
+    pacer = FramePacer(10, 2, smoothing=1.0)
+    ticks = iter([0.0, 0.1])
+    cpu = iter([0.0, 0.002])
+    monkeypatch.setattr(frame_pacer.time, 'perf_counter', lambda: next(ticks))
+    monkeypatch.setattr(frame_pacer.time, 'thread_time', lambda: next(cpu))
+    pacer.frame_done()
+    pacer.frame_done()
+    stats = pacer.stats()
+    assert stats['achieved_fps'] == pytest.approx(10.0)
+    assert stats['cpu_ms_per_frame'] == pytest.approx(2.0)
+    assert stats['target_fps'] == 10
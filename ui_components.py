@@ -32,6 +32,7 @@ class RadarScope:
         self.font = utils.load_font(config.RADAR_FONT_SIZE)
         self.degree_font = utils.load_font(int(config.RADAR_FONT_SIZE * 0.8))
         self.sweep_angle, self.rotation = 0, getattr(config, 'RADAR_ROTATION', 0)
+        self.last_sweep_time = time.monotonic()
         self.show_terrain = getattr(config, 'TERRAIN', False)
         self.terrain = TerrainOverlay('terrain.json') if self.show_terrain else None
         self.history = {} 
@@ -91,7 +92,10 @@ class RadarScope:
         pygame.draw.line(self.screen, theme['dim_green'], (self.center_x, self.center_y - self.radius), (self.center_x, self.center_y + self.radius), 1)
         pygame.draw.circle(self.screen, theme['bright_green'], (self.center_x, self.center_y), self.radius, 2)
 
-        self.sweep_angle = (self.sweep_angle + 2.4) % 360
+        # Sweep is time-based so its speed doesn't change with the adaptive frame rate
+        now = time.monotonic()
+        self.sweep_angle = (self.sweep_angle + 2.4 * config.FPS * (now - self.last_sweep_time)) % 360
+        self.last_sweep_time = now
         for i in range(12):
             rad = math.radians(self.sweep_angle - i)
             ex, ey = int(self.center_x + self.radius * math.sin(rad)), int(self.center_y - self.radius * math.cos(rad))